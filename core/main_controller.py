@@ -1,11 +1,180 @@
 import asyncio
-from .pdf_extractor import extract_text_from_pdf  # Adicione o '.' aqui
-from .speech_synthesizer import synthesize_speech, DEFAULT_VOICE, DEFAULT_OUTPUT_FILE
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+from .pdf_extractor import (
+    extract_pages,
+    get_cached_text,
+    get_normalized_text,
+    write_normalized_text,
+    cache_extracted_text,
+    _file_digest,
+    _normalize_text,
+)
+from .speech_synthesizer import (
+    synthesize_speech,
+    _looks_synthesizable,
+    _split_text,
+    _synth_to_bytes,
+    MAX_CHUNK_CHARS,
+    SYNTHESIS_CONCURRENCY,
+    DEFAULT_VOICE,
+    DEFAULT_OUTPUT_FILE,
+)
+
+logger = logging.getLogger(__name__)
+
+# Synthesized audio is cached keyed by a digest of (voice, text): repeat
+# conversions of the same text with the same voice become a local file copy
+# instead of a multi-second trip through Edge TTS.
+AUDIO_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "tts", "audio")
+
+def _cached_audio_path(text: str, voice: str) -> str:
+    """
+    Returns the cache location for audio synthesized from this (text, voice).
+    """
+    digest = hashlib.blake2b(f"{voice}\0{text}".encode(), digest_size=16).hexdigest()
+    return os.path.join(AUDIO_CACHE_DIR, f"{digest}.mp3")
+
+def _pdf_digest(pdf_file_path: str) -> str | None:
+    """
+    Returns the PDF's content digest, or None if the file can't be read.
+    """
+    try:
+        return _file_digest(pdf_file_path)
+    except OSError:
+        return None
+
+def _pdf_audio_alias_path(pdf_digest: str, voice: str) -> str:
+    """
+    Returns the cache location of the (pdf digest, voice) alias for a
+    synthesized audio file. Unlike the (voice, text) entry, checking this
+    alias needs no extracted text, so a repeat conversion of the same PDF
+    shortcuts even when the text caches are gone.
+    """
+    return os.path.join(AUDIO_CACHE_DIR, f"{pdf_digest}-{voice}.mp3")
+
+def _store_cached_audio(audio_path: str, cache_path: str) -> None:
+    """
+    Copies a freshly synthesized audio file into the cache. Best-effort and
+    atomic (temp file + os.replace), mirroring the text cache's behaviour.
+    """
+    try:
+        os.makedirs(AUDIO_CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=AUDIO_CACHE_DIR, suffix='.tmp')
+    except OSError:
+        return
+    try:
+        os.close(fd)
+        shutil.copyfile(audio_path, tmp_path)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Caching is best-effort, but don't litter the cache dir with the
+        # failed copy's temp file.
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+async def _pipelined_convert(
+    pdf_file_path: str,
+    output_audio_path: str,
+    voice: str,
+    progress_cb=None
+) -> tuple[str, bool]:
+    """
+    Extracts PDF pages and synthesizes speech concurrently.
+
+    Pages stream from the extractor into sentence chunks; each chunk is
+    synthesized on its own Edge TTS connection while later pages are still
+    being extracted, and the audio is appended to the output file in order.
+    A bounded queue of in-flight synthesis tasks provides back-pressure so
+    memory stays at a few chunks of audio regardless of PDF size.
+
+    Returns the full extracted text (so the caller can cache and inspect
+    it) and whether any audio was actually written: text can extract fine
+    yet contain nothing synthesizable, in which case no output file exists.
+    """
+    semaphore = asyncio.Semaphore(SYNTHESIS_CONCURRENCY)
+    synthesis_tasks: asyncio.Queue = asyncio.Queue(maxsize=SYNTHESIS_CONCURRENCY * 2)
+    # Every synthesis task ever created, so cleanup can reach tasks the
+    # consumer never got to (queued, or stuck in a blocked put).
+    created_tasks: list[asyncio.Task] = []
+    page_texts: list[str] = []
+
+    async def produce():
+        try:
+            buffer: list[str] = []
+            buffered = 0
+            async for page_text in extract_pages(pdf_file_path):
+                page_texts.append(page_text)
+                buffer.append(page_text)
+                buffered += len(page_text)
+                if buffered >= MAX_CHUNK_CHARS:
+                    pending = _normalize_text("\n".join(buffer))
+                    buffer = []
+                    buffered = 0
+                    for chunk in _split_text(pending):
+                        if not _looks_synthesizable(chunk):
+                            continue
+                        task = asyncio.create_task(_synth_to_bytes(chunk, voice, semaphore))
+                        created_tasks.append(task)
+                        await synthesis_tasks.put(task)
+            remainder = _normalize_text("\n".join(buffer))
+            for chunk in _split_text(remainder):
+                if not _looks_synthesizable(chunk):
+                    continue
+                task = asyncio.create_task(_synth_to_bytes(chunk, voice, semaphore))
+                created_tasks.append(task)
+                await synthesis_tasks.put(task)
+        finally:
+            # Sentinel so the consumer loop below always terminates.
+            await synthesis_tasks.put(None)
+
+    producer = asyncio.create_task(produce())
+    wrote_audio = False
+    bytes_written = 0
+    succeeded = False
+    try:
+        with open(output_audio_path, "wb") as audio_file:
+            while True:
+                task = await synthesis_tasks.get()
+                if task is None:
+                    break
+                part = await task
+                audio_file.write(part)
+                wrote_audio = True
+                bytes_written += len(part)
+                if progress_cb is not None:
+                    progress_cb(bytes_written)
+        await producer
+        succeeded = True
+    finally:
+        # On failure the producer and any tasks the consumer never reached
+        # are still running; cancel them and await everything so no chunk
+        # keeps streaming with no consumer or logs its exception as never
+        # retrieved. cancel() on finished tasks is a no-op.
+        producer.cancel()
+        for task in created_tasks:
+            task.cancel()
+        await asyncio.gather(producer, *created_tasks, return_exceptions=True)
+        if not (succeeded and wrote_audio):
+            # Don't leave a partial (failure) or empty (nothing
+            # synthesizable) output file behind.
+            try:
+                os.remove(output_audio_path)
+            except OSError:
+                pass
+
+    return _normalize_text("\n".join(page_texts)), wrote_audio
 
 async def convert_pdf_to_speech(
     pdf_file_path: str,
     output_audio_path: str = DEFAULT_OUTPUT_FILE,
-    voice: str = DEFAULT_VOICE
+    voice: str = DEFAULT_VOICE,
+    progress_cb=None
 ) -> tuple[bool, str]:
     """
     Orchestrates the conversion of a PDF file to a speech audio file.
@@ -19,56 +188,146 @@ async def convert_pdf_to_speech(
                                            defined in speech_synthesizer.
         voice (str, optional): The voice to be used for speech synthesis. Defaults to the
                                DEFAULT_VOICE defined in speech_synthesizer.
+        progress_cb (callable, optional): Called with the total number of audio bytes
+                                          written so far as synthesis progresses.
 
     Returns:
         tuple[bool, str]: A tuple containing:
                           - bool: True if the conversion was successful, False otherwise.
                           - str: A message indicating the result or error.
     """
-    print(f"Starting PDF to speech conversion for: {pdf_file_path}")
+    logger.info("Starting PDF to speech conversion for: %s", pdf_file_path)
 
-    # Step 1: Extract text from PDF
+    # Step 0: A direct (pdf digest, voice) audio alias turns a repeat
+    # conversion into a file copy without needing any extracted text.
+    pdf_digest = await asyncio.to_thread(_pdf_digest, pdf_file_path)
+    alias_path = _pdf_audio_alias_path(pdf_digest, voice) if pdf_digest else None
+    if alias_path and os.path.exists(alias_path):
+        logger.info("Using cached audio for this PDF and voice '%s'.", voice)
+        await asyncio.to_thread(shutil.copyfile, alias_path, output_audio_path)
+        message = f"Successfully converted PDF to speech. Audio saved to '{output_audio_path}'."
+        logger.info(message)
+        return True, message
+
+    # Step 1: Look for previously extracted text: first the side-car
+    # '.normalized.txt' next to the PDF (a plain stat + read), then the
+    # hash-keyed extraction cache. The cache lookup hashes the whole PDF,
+    # so both run in a worker thread to keep the event loop free.
+    extracted_text = await asyncio.to_thread(get_normalized_text, pdf_file_path)
+    if extracted_text is None:
+        extracted_text = await asyncio.to_thread(get_cached_text, pdf_file_path)
+
+    # Step 2: Synthesize speech (overlapped with extraction on a cache miss)
     try:
-        print("Extracting text from PDF...")
-        extracted_text = extract_text_from_pdf(pdf_file_path)
-        if not extracted_text:
-            message = f"No text could be extracted from '{pdf_file_path}' or the PDF is empty."
-            print(message)
+        if extracted_text and not _looks_synthesizable(extracted_text):
+            message = f"Text from '{pdf_file_path}' has no readable content to synthesize."
+            logger.error(message)
             return False, message
-        print(f"Text extracted successfully. Length: {len(extracted_text)} characters.")
-        # For brevity in logs, let's print only a snippet
-        print(f"Extracted text snippet: '{extracted_text[:100]}...'")
-    except FileNotFoundError:
-        message = f"Error: PDF file not found at '{pdf_file_path}'."
-        print(message)
-        return False, message
-    except Exception as e:
-        message = f"An unexpected error occurred during PDF text extraction: {e}"
-        print(message)
-        return False, message
 
-    # Step 2: Synthesize speech from extracted text
-    try:
-        print(f"\nSynthesizing speech to '{output_audio_path}' using voice '{voice}'...")
-        success = await synthesize_speech(
-            text=extracted_text,
-            output_filename=output_audio_path,
-            voice=voice
-        )
+        if extracted_text:
+            logger.info("Using cached text. Length: %d characters.", len(extracted_text))
+            # For brevity in logs, only a snippet
+            logger.info("Extracted text snippet: '%s...'", extracted_text[:100])
+            audio_cache_path = _cached_audio_path(extracted_text, voice)
+            if os.path.exists(audio_cache_path):
+                # This exact (text, voice) pair has been synthesized before.
+                logger.info("Using cached audio for voice '%s'.", voice)
+                await asyncio.to_thread(shutil.copyfile, audio_cache_path, output_audio_path)
+                success = True
+            else:
+                logger.info("Synthesizing speech to '%s' using voice '%s'...", output_audio_path, voice)
+                success = await synthesize_speech(
+                    text=extracted_text,
+                    output_filename=output_audio_path,
+                    voice=voice,
+                    progress_cb=progress_cb
+                )
+                if success:
+                    await asyncio.to_thread(_store_cached_audio, output_audio_path, audio_cache_path)
+        else:
+            # Extraction and synthesis run as a pipeline: chunks of early
+            # pages are synthesized while later pages are still being parsed.
+            logger.info("Extracting text and synthesizing speech to '%s' using voice '%s'...", output_audio_path, voice)
+            extracted_text, wrote_audio = await _pipelined_convert(
+                pdf_file_path, output_audio_path, voice, progress_cb=progress_cb
+            )
+            if not extracted_text:
+                message = f"No text could be extracted from '{pdf_file_path}' or the PDF is empty."
+                logger.error(message)
+                return False, message
+            logger.info("Text extracted successfully. Length: %d characters.", len(extracted_text))
+            # Persist the text both ways: the hash-keyed cache survives the
+            # PDF moving, and the side-car next to the PDF lets the next run
+            # skip hashing the PDF entirely.
+            await asyncio.to_thread(cache_extracted_text, pdf_file_path, extracted_text)
+            await asyncio.to_thread(write_normalized_text, pdf_file_path, extracted_text)
+            if not wrote_audio:
+                # Extraction worked but no chunk was worth synthesizing, so
+                # there is no output file. Report the same failure the
+                # cached-text path does; the text cache write above makes a
+                # rerun fail fast without re-parsing.
+                message = f"Text from '{pdf_file_path}' has no readable content to synthesize."
+                logger.error(message)
+                return False, message
+            await asyncio.to_thread(
+                _store_cached_audio, output_audio_path, _cached_audio_path(extracted_text, voice)
+            )
+            success = True
 
         if success:
+            if alias_path:
+                await asyncio.to_thread(_store_cached_audio, output_audio_path, alias_path)
             message = f"Successfully converted PDF to speech. Audio saved to '{output_audio_path}'."
-            print(message)
+            logger.info(message)
             return True, message
         else:
             message = "Speech synthesis failed. Please check earlier logs from speech_synthesizer for details."
-            print(message)
+            logger.error(message)
             return False, message
+    except FileNotFoundError:
+        message = f"Error: PDF file not found at '{pdf_file_path}'."
+        logger.error(message)
+        return False, message
     except Exception as e:
-        message = f"An unexpected error occurred during speech synthesis orchestration: {e}"
-        print(message)
+        message = f"An unexpected error occurred during PDF to speech conversion: {e}"
+        logger.error(message)
         return False, message
 
+async def convert_many(
+    jobs: list[tuple[str, str, str]],
+    concurrency: int = 4
+) -> list[tuple[bool, str]]:
+    """
+    Converts a batch of PDFs to speech concurrently.
+
+    Each job is a (pdf_file_path, output_audio_path, voice) tuple. At most
+    `concurrency` conversions run at once, bounded by a semaphore; all jobs
+    share this process's voice cache, extraction/audio caches and event
+    loop, so per-job startup costs are amortized across the batch. A failure
+    in one job does not abort the others.
+
+    Args:
+        jobs (list[tuple[str, str, str]]): The conversion jobs to run.
+        concurrency (int, optional): Maximum conversions in flight.
+                                     Defaults to 4.
+
+    Returns:
+        list[tuple[bool, str]]: The (success, message) result of each job,
+                                in the same order as the input.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _guarded(pdf_file_path: str, output_audio_path: str, voice: str):
+        async with semaphore:
+            try:
+                return await convert_pdf_to_speech(pdf_file_path, output_audio_path, voice)
+            except Exception as e:
+                message = f"Conversion of '{pdf_file_path}' failed: {e}"
+                logger.error(message)
+                return False, message
+
+    return list(await asyncio.gather(*(_guarded(*job) for job in jobs)))
+
 async def main_test_controller():
     """
     A simple main function to test the PDF to speech conversion process.
@@ -152,6 +411,7 @@ if __name__ == "__main__":
     # You might need to install PyPDF2 if you want the dummy PDF creation to work:
     # pip install PyPDF2
     # However, it's better if you provide your own 'sample.pdf'.
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
     try:
         asyncio.run(main_test_controller())
     except KeyboardInterrupt:
@@ -1,50 +1,287 @@
-import PyPDF2
+import asyncio
+import concurrent.futures
+import hashlib
+import io
+import logging
+import os
+import re
+import tempfile
 
-def extract_text_from_pdf(pdf_file_path: str) -> str | None:
+import fitz  # PyMuPDF
+
+logger = logging.getLogger(__name__)
+
+# Precompiled normalization patterns: each is a single C-level pass over the
+# whole text, far cheaper than any per-line cleanup in Python.
+_HYPHEN_BREAK = re.compile(r'(\w)-\n(\w)')  # words hyphenated across lines
+_RUNS_OF_BLANKS = re.compile(r'[ \t]+')
+_EXCESS_NEWLINES = re.compile(r'\n{3,}')
+
+def _normalize_text(text: str) -> str:
+    """
+    Cleans up raw extracted text for speech synthesis: rejoins words
+    hyphenated across line breaks, collapses runs of spaces/tabs, and trims
+    excess blank lines.
+    """
+    text = _HYPHEN_BREAK.sub(r'\1\2', text)
+    text = _RUNS_OF_BLANKS.sub(' ', text)
+    text = _EXCESS_NEWLINES.sub('\n\n', text)
+    return text.strip()
+
+# Below this page count the fork/spawn overhead of a process pool outweighs
+# the parallel extraction win, so small PDFs stay on the serial path.
+MIN_PAGES_FOR_PARALLEL = 4
+
+# Directory for cached extraction results, keyed by the PDF's content hash.
+# Re-running the same PDF (e.g. with a different voice) then costs a single
+# file read instead of a full parse.
+TEXT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "tts", "pdftext")
+
+def _file_digest(file_path: str) -> str:
+    """
+    Computes a hex digest of the file's content, used as the cache key.
+    Hashes in 1 MiB blocks so even very large PDFs need constant memory
+    rather than being read whole.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _read_cached_text(cache_path: str) -> str | None:
+    """
+    Returns the cached text for the given cache file, or None on a miss.
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+def _write_cached_text(cache_path: str, text: str) -> None:
+    """
+    Atomically writes extracted text to the cache (temp file + os.replace),
+    so a concurrent reader never sees a partially written entry.
+    """
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Caching is best-effort; extraction already succeeded.
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+def get_cached_text(pdf_file_path: str) -> str | None:
+    """
+    Returns the cached extraction result for the given PDF, or None if this
+    file has not been extracted before (or the cache cannot be read).
+    """
+    try:
+        cache_path = os.path.join(TEXT_CACHE_DIR, f"{_file_digest(pdf_file_path)}.txt")
+    except OSError:
+        return None
+    return _read_cached_text(cache_path)
+
+def cache_extracted_text(pdf_file_path: str, text: str) -> None:
+    """
+    Stores extracted text in the cache for the given PDF, for callers that
+    extract through a path other than extract_text_from_pdf. Best-effort.
+    """
+    try:
+        cache_path = os.path.join(TEXT_CACHE_DIR, f"{_file_digest(pdf_file_path)}.txt")
+    except OSError:
+        return
+    _write_cached_text(cache_path, text)
+
+def _normalized_txt_path(pdf_file_path: str) -> str:
+    """
+    Returns the path of the side-car text file kept next to the PDF.
+    """
+    return os.path.splitext(pdf_file_path)[0] + ".normalized.txt"
+
+def normalize_pdf(pdf_file_path: str) -> str | None:
+    """
+    Extracts and normalizes the PDF's text once, persisting it to a
+    '.normalized.txt' file next to the PDF. Subsequent runs (voice swaps,
+    retries) can read that file instead of re-parsing the PDF at all.
+
+    Args:
+        pdf_file_path (str): The path to the PDF file.
+
+    Returns:
+        str | None: The path of the written text file, or None if
+                    extraction failed.
+    """
+    text = extract_text_from_pdf(pdf_file_path)
+    if text is None:
+        return None
+    txt_path = _normalized_txt_path(pdf_file_path)
+    _write_cached_text(txt_path, text)
+    return txt_path
+
+def write_normalized_text(pdf_file_path: str, text: str) -> None:
+    """
+    Persists already-extracted, normalized text to the PDF's side-car
+    '.normalized.txt' file, for callers that extracted through a path other
+    than normalize_pdf. Best-effort.
+    """
+    _write_cached_text(_normalized_txt_path(pdf_file_path), text)
+
+def get_normalized_text(pdf_file_path: str) -> str | None:
+    """
+    Returns the text from the PDF's side-car '.normalized.txt' file if it
+    exists and is at least as new as the PDF itself, otherwise None. Unlike
+    the hash-keyed cache this requires no hashing of the PDF at all.
+    """
+    txt_path = _normalized_txt_path(pdf_file_path)
+    try:
+        if os.path.getmtime(txt_path) < os.path.getmtime(pdf_file_path):
+            return None  # PDF changed since the side-car was written
+    except OSError:
+        return None
+    return _read_cached_text(txt_path)
+
+async def extract_pages(pdf_file_path: str):
+    """
+    Asynchronously yields the text of each page of the PDF, in order.
+
+    The blocking PyMuPDF calls run in worker threads (asyncio.to_thread), so
+    the event loop stays free and callers can overlap downstream work such as
+    speech synthesis with extraction of later pages.
+
+    Unlike extract_text_from_pdf, this propagates the underlying errors
+    instead of returning None, and does not touch the extraction cache.
+    """
+    try:
+        doc = await asyncio.to_thread(fitz.open, pdf_file_path)
+    except fitz.FileNotFoundError as e:
+        # fitz's FileNotFoundError subclasses RuntimeError, not the
+        # builtin; translate so callers' missing-file handlers work.
+        raise FileNotFoundError(str(e)) from e
+    try:
+        if doc.needs_pass and not doc.authenticate(""):
+            raise ValueError(f"PDF '{pdf_file_path}' is password-protected.")
+        for page in doc:
+            yield await asyncio.to_thread(page.get_text, "text")
+    finally:
+        doc.close()
+
+def _extract_page_range(pdf_file_path: str, start: int, stop: int) -> list[str]:
+    """
+    Worker for parallel extraction: opens the PDF in this process and returns
+    the text of pages [start, stop). Each worker opens the file itself
+    (fitz.open is cheap and the OS shares the page cache across processes),
+    and handles a contiguous range so the open cost is amortized over many pages.
+    """
+    with fitz.open(pdf_file_path) as doc:
+        if doc.needs_pass:
+            doc.authenticate("")
+        return [page.get_text("text") for page in doc.pages(start, stop)]
+
+def _extract_pages_parallel(pdf_file_path: str, page_count: int) -> list[str]:
+    """
+    Extracts all pages of the PDF across a process pool, preserving page order.
+    """
+    workers = min(os.cpu_count() or 1, page_count)
+    # Split pages into one contiguous range per worker.
+    per_worker = -(-page_count // workers)  # ceil division
+    ranges = [
+        (start, min(start + per_worker, page_count))
+        for start in range(0, page_count, per_worker)
+    ]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            _extract_page_range,
+            [pdf_file_path] * len(ranges),
+            [r[0] for r in ranges],
+            [r[1] for r in ranges],
+        )
+        return [text for chunk in results for text in chunk]
+
+def extract_text_from_pdf(pdf_file_path: str, use_cache: bool = True) -> str | None:
     """
     Extracts all text content from a given PDF file.
 
+    Results are cached under TEXT_CACHE_DIR keyed by the PDF's content hash,
+    so repeated extractions of an unchanged file skip parsing entirely.
+
     Args:
         pdf_file_path (str): The path to the PDF file.
+        use_cache (bool, optional): Whether to read/write the extraction cache.
+                                    Defaults to True.
 
     Returns:
         str | None: The extracted text as a single string, or None if
                     the file cannot be opened, is encrypted, or an error occurs.
     """
+    cache_path = None
     try:
-        with open(pdf_file_path, 'rb') as pdf_file_obj:
-            pdf_reader = PyPDF2.PdfReader(pdf_file_obj)
-
-            # Check if the PDF is encrypted
-            if pdf_reader.is_encrypted:
-                try:
-                    # Attempt to decrypt with an empty password
-                    # For PDFs with actual passwords, this would need to be handled differently
-                    pdf_reader.decrypt('')
-                except Exception as e:
-                    print(f"Error: Could not decrypt PDF '{pdf_file_path}'. It might be password-protected. Error: {e}")
-                    return None
-
-            text_content = []
-            for page_num in range(len(pdf_reader.pages)):
-                page_obj = pdf_reader.pages[page_num]
-                text_content.append(page_obj.extract_text())
-
-            full_text = "\n".join(text_content).strip()
+        if use_cache:
+            try:
+                cache_path = os.path.join(TEXT_CACHE_DIR, f"{_file_digest(pdf_file_path)}.txt")
+                cached_text = _read_cached_text(cache_path)
+                if cached_text is not None:
+                    return cached_text
+            except FileNotFoundError:
+                # Let the extraction path below produce the usual error message.
+                pass
+
+        # PyMuPDF only accepts bytes-like streams, not an mmap object, and
+        # copying the map into bytes would defeat the point; open by path
+        # and let MuPDF do its own buffered reads. The probe open keeps a
+        # missing file surfacing as the builtin FileNotFoundError (fitz's
+        # own is a RuntimeError subclass).
+        with open(pdf_file_path, 'rb'):
+            pass
+        with fitz.open(pdf_file_path) as doc:
+            # needs_pass is a single header flag, so unencrypted PDFs (the
+            # common case) pay nothing here. Try an empty password and fail
+            # fast if that doesn't unlock the document; extracting from a
+            # locked document would only produce empty pages.
+            if doc.needs_pass and not doc.authenticate(""):
+                logger.error("Could not decrypt PDF '%s'. It might be password-protected.", pdf_file_path)
+                return None
+
+            # Accumulate into a single growing buffer instead of a list of
+            # page strings plus a join, which transiently holds ~2x the text.
+            buf = io.StringIO()
+            if doc.page_count >= MIN_PAGES_FOR_PARALLEL:
+                for page_text in _extract_pages_parallel(pdf_file_path, doc.page_count):
+                    if page_text:
+                        buf.write(page_text)
+                        buf.write("\n")
+            else:
+                for page in doc:
+                    page_text = page.get_text("text")
+                    if page_text:
+                        buf.write(page_text)
+                        buf.write("\n")
+
+            full_text = _normalize_text(buf.getvalue())
             if not full_text:
-                print(f"Warning: No text found in '{pdf_file_path}', or text extraction yielded an empty string.")
+                logger.warning("No text found in '%s', or text extraction yielded an empty string.", pdf_file_path)
+            if use_cache and cache_path is not None:
+                _write_cached_text(cache_path, full_text)
             return full_text
     except FileNotFoundError:
-        print(f"Error: The file '{pdf_file_path}' was not found.")
+        logger.error("The file '%s' was not found.", pdf_file_path)
         return None
-    except PyPDF2.errors.PdfReadError as e:
-        print(f"Error: Could not read PDF file '{pdf_file_path}'. It might be corrupted or not a valid PDF. Details: {e}")
+    except fitz.FileDataError as e:
+        logger.error("Could not read PDF file '%s'. It might be corrupted or not a valid PDF. Details: %s", pdf_file_path, e)
         return None
     except Exception as e:
-        print(f"An unexpected error occurred while processing '{pdf_file_path}': {e}")
+        logger.error("An unexpected error occurred while processing '%s': %s", pdf_file_path, e)
         return None
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+
     # This is a simple test block that runs if you execute this script directly.
     # For this to work, you'll need a sample PDF.
     # Let's assume you have a 'sample.pdf' in the same directory as this script
@@ -58,27 +295,15 @@ if __name__ == '__main__':
             print(f"Using existing PDF for test: {test_pdf_path}")
     except FileNotFoundError:
         try:
-            # Create a very simple PDF with one line of text using PyPDF2
+            # Create a very simple PDF with one line of text using reportlab
             # This requires reportlab to be installed: pip install reportlab
-            import io
             from reportlab.pdfgen import canvas
             from reportlab.lib.pagesizes import letter
-            from PyPDF2 import PdfWriter, PdfReader
 
-            packet = io.BytesIO()
-            can = canvas.Canvas(packet, pagesize=letter)
+            can = canvas.Canvas(test_pdf_path, pagesize=letter)
             can.drawString(72, 750, "This is a test sentence for the PDF extractor module.")
-            can.drawString(72, 730, "Hello world from PyPDF2 and ReportLab!")
+            can.drawString(72, 730, "Hello world from PyMuPDF and ReportLab!")
             can.save()
-            packet.seek(0) # Move the "cursor" to the beginning of the BytesIO stream
-
-            new_pdf_reader = PdfReader(packet)
-            writer = PdfWriter()
-            for page in new_pdf_reader.pages:
-                writer.add_page(page)
-
-            with open(test_pdf_path, "wb") as f_out:
-                writer.write(f_out)
             print(f"Created a dummy PDF for testing: {test_pdf_path}")
 
         except ImportError:
@@ -109,4 +334,4 @@ if __name__ == '__main__':
         print("Correctly handled non-existent file.")
 
     # You might also want to test with an encrypted PDF (without password)
-    # and a corrupted PDF if you have samples.
\ No newline at end of file
+    # and a corrupted PDF if you have samples.
@@ -1,6 +1,17 @@
 import asyncio
+import json
+import logging
+import os
+import random
+import re
+import tempfile
+import time
+from collections import defaultdict
+
+import aiohttp
 import edge_tts
-from edge_tts import VoicesManager
+
+logger = logging.getLogger(__name__)
 
 # A default voice to use if none is specified.
 # You can find a list of available voices here:
@@ -9,27 +20,224 @@ from edge_tts import VoicesManager
 DEFAULT_VOICE = "en-US-AriaNeural"
 DEFAULT_OUTPUT_FILE = "output.mp3"
 
+# Target size for the text chunks sent as separate Edge TTS requests.
+MAX_CHUNK_CHARS = 2000
+# Number of chunks synthesized concurrently. Each Edge TTS connection is
+# individually throttled, so a few parallel connections multiply throughput;
+# kept low to stay well clear of the service's abuse limits.
+SYNTHESIS_CONCURRENCY = 4
+# Transient Edge TTS failures are routine; each chunk gets this many attempts
+# with exponential backoff before the error propagates.
+MAX_SYNTH_ATTEMPTS = 5
+
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+
+# Minimum alphabetic characters for text to be worth a synthesis request.
+MIN_ALPHA_CHARS = 20
+
+def _looks_synthesizable(text: str) -> bool:
+    """
+    Quick heuristic for whether text is worth sending to Edge TTS. Scans at
+    most the first few KB and requires a handful of alphabetic characters,
+    so page-number noise or bare punctuation fails fast locally instead of
+    costing a doomed network round-trip.
+    """
+    alpha_count = 0
+    for char in text[:4096]:
+        if char.isalpha():
+            alpha_count += 1
+            if alpha_count >= MIN_ALPHA_CHARS:
+                return True
+    return False
+
+# The voice manifest is static for the life of the process, so it is fetched
+# from Microsoft's servers at most once and served from memory afterwards.
+# It also changes rarely across runs, so it is persisted to disk with a TTL:
+# a fresh process (e.g. a GUI restart) reads the file instead of making an
+# HTTPS round-trip, and a stale file still serves as a fallback when the
+# network is down.
+_voices_cache: list | None = None
+_voices_cache_lock = asyncio.Lock()
+
+VOICES_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "tts", "voices.json")
+VOICES_CACHE_TTL = 24 * 60 * 60  # seconds
+
+def _read_voices_file(allow_stale: bool = False) -> list | None:
+    """
+    Reads the persisted voice list, honoring the TTL unless allow_stale is
+    set. Returns None on a miss or unreadable file.
+    """
+    try:
+        if not allow_stale and time.time() - os.path.getmtime(VOICES_CACHE_FILE) >= VOICES_CACHE_TTL:
+            return None
+        with open(VOICES_CACHE_FILE, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _write_voices_file(voices: list) -> None:
+    """
+    Atomically persists the voice list (temp file + os.replace). Best-effort.
+    """
+    try:
+        os.makedirs(os.path.dirname(VOICES_CACHE_FILE), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(VOICES_CACHE_FILE), suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(voices, f)
+        os.replace(tmp_path, VOICES_CACHE_FILE)
+    except OSError:
+        pass
+
+# Filter indexes over the cached voice list, keyed by lowercased values and
+# built once at cache-load time so each filter is a dict lookup instead of a
+# full scan with per-element lowercasing.
+_voices_by_language: dict[str, list] = {}
+_voices_by_gender: dict[str, list] = {}
+_voices_by_locale: dict[str, list] = {}
+
+def _build_voice_indexes(voices: list) -> None:
+    """
+    Populates the language/gender/locale indexes for the given voice list.
+    """
+    by_language: dict[str, list] = defaultdict(list)
+    by_gender: dict[str, list] = defaultdict(list)
+    by_locale: dict[str, list] = defaultdict(list)
+    for voice in voices:
+        locale = voice['Locale'].lower()
+        by_language[locale.partition('-')[0]].append(voice)
+        by_gender[voice['Gender'].lower()].append(voice)
+        by_locale[locale].append(voice)
+    _voices_by_language.clear()
+    _voices_by_language.update(by_language)
+    _voices_by_gender.clear()
+    _voices_by_gender.update(by_gender)
+    _voices_by_locale.clear()
+    _voices_by_locale.update(by_locale)
+
+async def get_all_voices() -> list:
+    """
+    Returns the full Edge TTS voice list.
+
+    Lookup order: in-memory cache, then the on-disk cache (if younger than
+    VOICES_CACHE_TTL), then the network. A successful fetch refreshes the
+    disk cache; if the fetch fails and a stale disk copy exists, the stale
+    copy is served rather than failing outright.
+    """
+    global _voices_cache
+    async with _voices_cache_lock:
+        if _voices_cache is None:
+            voices = await asyncio.to_thread(_read_voices_file)
+            if voices is None:
+                try:
+                    voices = await edge_tts.list_voices()
+                except Exception:
+                    voices = await asyncio.to_thread(_read_voices_file, True)
+                    if voices is None:
+                        raise
+                    logger.warning("Fetching the voice list failed; using the stale cached copy.")
+                else:
+                    await asyncio.to_thread(_write_voices_file, voices)
+            _voices_cache = voices
+            _build_voice_indexes(_voices_cache)
+    return _voices_cache
+
 async def list_available_voices(language: str = None, gender: str = None, locale_str: str = None) -> list:
     """
     Retrieves a list of available voices from Edge TTS, optionally filtered by language, gender, or locale.
     """
     try:
-        voices = await edge_tts.list_voices()  # <-- CORRETO!
+        voices = await get_all_voices()
+        # Each active filter is a dict lookup; multiple filters intersect.
+        # Matching is exact (e.g. language "en" matches "en-US" but "e" does
+        # not), unlike the substring comparison this replaces.
+        candidate_sets = []
         if language:
-            voices = [v for v in voices if language.lower() in v['Locale'].lower().split('-')[0]]
+            candidate_sets.append({id(v) for v in _voices_by_language.get(language.lower(), [])})
         if gender:
-            voices = [v for v in voices if gender.lower() == v['Gender'].lower()]
+            candidate_sets.append({id(v) for v in _voices_by_gender.get(gender.lower(), [])})
         if locale_str:
-            voices = [v for v in voices if locale_str.lower() in v['Locale'].lower()]
+            candidate_sets.append({id(v) for v in _voices_by_locale.get(locale_str.lower(), [])})
+        if candidate_sets:
+            selected = set.intersection(*candidate_sets)
+            voices = [v for v in voices if id(v) in selected]
         return voices
     except Exception as e:
-        print(f"Error listing voices: {e}")
+        logger.error("Error listing voices: %s", e)
         return []
 
+def _split_text(text: str, max_chars: int = MAX_CHUNK_CHARS) -> list[str]:
+    """
+    Splits text into chunks of at most max_chars, breaking on sentence
+    boundaries so each chunk is a natural unit of speech. A single sentence
+    longer than max_chars becomes its own (oversized) chunk.
+    """
+    chunks = []
+    current: list[str] = []
+    current_len = 0
+    for sentence in _SENTENCE_BOUNDARY.split(text):
+        if not sentence:
+            continue
+        if current and current_len + len(sentence) + 1 > max_chars:
+            chunks.append(" ".join(current))
+            current = []
+            current_len = 0
+        current.append(sentence)
+        current_len += len(sentence) + 1
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+async def _synth_to_bytes(text: str, voice: str, semaphore: asyncio.Semaphore) -> bytes:
+    """
+    Synthesizes one text chunk and returns its complete MP3 data, holding
+    the semaphore for the duration to bound concurrent connections.
+
+    Transient service failures are retried per chunk with exponential
+    backoff, so one hiccup doesn't force re-synthesizing the whole text.
+    """
+    async with semaphore:
+        for attempt in range(MAX_SYNTH_ATTEMPTS):
+            try:
+                # A single growing bytearray avoids materializing many small
+                # bytes objects plus a second full-size copy during a join.
+                buf = bytearray()
+                async for data in synthesize_speech_stream(text, voice):
+                    buf.extend(data)
+                return bytes(buf)
+            except (edge_tts.exceptions.NoAudioReceived, aiohttp.ClientError) as e:
+                if attempt == MAX_SYNTH_ATTEMPTS - 1:
+                    raise
+                delay = 0.25 * 2 ** attempt + random.random() * 0.1
+                logger.warning(
+                    "Synthesis attempt %d/%d failed (%s); retrying in %.2fs",
+                    attempt + 1, MAX_SYNTH_ATTEMPTS, e, delay
+                )
+                await asyncio.sleep(delay)
+
+async def synthesize_speech_stream(text: str, voice: str = DEFAULT_VOICE):
+    """
+    Asynchronously yields MP3 audio chunks for the given text as Edge TTS
+    produces them. Useful for piping audio to a player or file without
+    waiting for the full synthesis to finish.
+
+    Args:
+        text (str): The text content to be converted to speech.
+        voice (str, optional): The voice to be used for synthesis.
+                               Defaults to "en-US-AriaNeural".
+
+    Yields:
+        bytes: Consecutive chunks of MP3 audio data.
+    """
+    communicate = edge_tts.Communicate(text, voice)
+    async for chunk in communicate.stream():
+        if chunk["type"] == "audio":
+            yield chunk["data"]
+
 async def synthesize_speech(
     text: str,
     output_filename: str = DEFAULT_OUTPUT_FILE,
-    voice: str = DEFAULT_VOICE
+    voice: str = DEFAULT_VOICE,
+    progress_cb=None
 ) -> bool:
     """
     Synthesizes speech from the given text using Edge TTS and saves it to an audio file.
@@ -44,29 +252,80 @@ async def synthesize_speech(
                                Defaults to "en-US-AriaNeural".
                                A list of available voices can be obtained using `edge-tts --list-voices`
                                or the `list_available_voices` function.
+        progress_cb (callable, optional): Called with the total number of
+                               audio bytes written so far, each time a chunk
+                               is flushed to disk.
 
     Returns:
         bool: True if synthesis was successful and the file was saved, False otherwise.
     """
     if not text.strip():
-        print("Error: No text provided for speech synthesis.")
+        logger.error("No text provided for speech synthesis.")
+        return False
+    if not _looks_synthesizable(text):
+        logger.error("Text does not contain enough readable content for speech synthesis.")
         return False
 
     try:
-        print(f"Starting speech synthesis for: '{text[:50]}...'")
-        print(f"Using voice: {voice}")
-        print(f"Output file: {output_filename}")
+        logger.info("Starting speech synthesis for: '%s...'", text[:50])
+        logger.info("Using voice: %s", voice)
+        logger.info("Output file: %s", output_filename)
 
-        communicate = edge_tts.Communicate(text, voice)
-        await communicate.save(output_filename)
-        
-        print(f"Speech successfully synthesized and saved to {output_filename}")
+        bytes_written = 0
+        text_chunks = _split_text(text)
+        if len(text_chunks) == 1:
+            # Short text: a single request, streamed straight to disk as
+            # audio chunks arrive so peak memory stays at one chunk.
+            with open(output_filename, "wb") as audio_file:
+                async for chunk in synthesize_speech_stream(text, voice):
+                    audio_file.write(chunk)
+                    bytes_written += len(chunk)
+                    if progress_cb is not None:
+                        progress_cb(bytes_written)
+        else:
+            # Long text: each Edge TTS connection is throttled individually,
+            # so synthesize sentence chunks over a few concurrent connections
+            # and concatenate the results in order (MP3 frame streams can be
+            # concatenated without re-encoding).
+            logger.info("Synthesizing in %d chunks...", len(text_chunks))
+            semaphore = asyncio.Semaphore(SYNTHESIS_CONCURRENCY)
+            tasks = [
+                asyncio.create_task(_synth_to_bytes(chunk, voice, semaphore))
+                for chunk in text_chunks
+            ]
+            # Write each chunk as soon as it is both finished and next in
+            # order, so completed audio is released instead of accumulating
+            # until the whole gather resolves.
+            ok = False
+            try:
+                with open(output_filename, "wb") as audio_file:
+                    for task in tasks:
+                        part = await task
+                        audio_file.write(part)
+                        bytes_written += len(part)
+                        if progress_cb is not None:
+                            progress_cb(bytes_written)
+                ok = True
+            finally:
+                if not ok:
+                    # One chunk failed; cancel and await the rest so they
+                    # stop synthesizing with no consumer, and don't leave a
+                    # partial output file behind.
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                    try:
+                        os.remove(output_filename)
+                    except OSError:
+                        pass
+
+        logger.info("Speech successfully synthesized and saved to %s", output_filename)
         return True
     except edge_tts.exceptions.NoAudioReceived:
-        print(f"Error: No audio received from Edge TTS. This might be due to an invalid voice or an issue with the service.")
+        logger.error("No audio received from Edge TTS. This might be due to an invalid voice or an issue with the service.")
         return False
     except Exception as e:
-        print(f"An unexpected error occurred during speech synthesis: {e}")
+        logger.error("An unexpected error occurred during speech synthesis: %s", e)
         return False
 
 async def main_test():
@@ -106,6 +365,7 @@ async def main_test():
 
 if __name__ == "__main__":
     # This block allows you to run this script directly for testing.
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
     try:
         asyncio.run(main_test())
     except KeyboardInterrupt:
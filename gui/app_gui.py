@@ -1,8 +1,11 @@
 import tkinter as tk
-from tkinter import filedialog, messagebox
+from tkinter import filedialog, messagebox, ttk
 import asyncio
+import logging
+import queue
 import threading
-import os 
+import os
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 
 import sys
 # Get the absolute path of the project's root directory
@@ -10,9 +13,12 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from core.main_controller import convert_pdf_to_speech
-import edge_tts 
-from core.speech_synthesizer import DEFAULT_VOICE 
+# core.main_controller and core.speech_synthesizer pull in the PDF and TTS
+# stacks (PyMuPDF, edge-tts/aiohttp), which dominate startup time. They are
+# imported lazily inside the worker jobs that first need them, so the window
+# appears immediately and the import cost is paid off the Tk thread.
+
+logger = logging.getLogger(__name__)
 
 class PdfToSpeechApp:
     """
@@ -30,9 +36,11 @@ class PdfToSpeechApp:
         self.root.geometry("600x500") # Slightly increase height for the new dropdown
 
         self.selected_pdf_path = tk.StringVar()
+        # Basename of the selected PDF, computed once at selection time and
+        # reused by the status messages and output-path construction.
+        self._selected_pdf_basename = ""
         self.selected_language_display = tk.StringVar() # For the user-friendly language name
         self.selected_voice = tk.StringVar()
-        self.status_message = tk.StringVar()
 
         # Mapping of language display names to their codes (e.g., "en", "pt-BR")
         # You can expand this list. Use locale codes that edge-tts understands.
@@ -46,8 +54,45 @@ class PdfToSpeechApp:
             "French (France)": "fr-FR",
             "German (Germany)": "de-DE",
         }
+        # Locale prefixes (e.g. "en" for "en-US") precomputed once so a
+        # language switch doesn't re-split and re-lowercase the code string.
+        self._lang_prefix_by_code = {
+            code: code.partition('-')[0].lower()
+            for code in self.available_languages_map.values()
+        }
         # Map for loaded voices (display name -> short voice name)
         self.loaded_voices_map = {}
+        # Per-language-prefix display maps ("Name (Gender)" -> ShortName),
+        # built once after the first voice fetch. A language switch is then
+        # a single dict lookup with no scanning or string formatting at all.
+        self._display_map_by_prefix = None
+
+        # One asyncio event loop for the app's lifetime, running on a
+        # background thread. Submitting coroutines to it avoids the loop
+        # setup/teardown cost of new_event_loop/run_until_complete per
+        # action and keeps edge-tts's connections reusable between calls.
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # UI updates queued from worker threads land in a lock-free queue
+        # drained by a single repeating ~60 Hz pump, so worker threads never
+        # schedule Tk callbacks themselves and update bursts are applied in
+        # batches instead of one wakeup each.
+        self._ui_ops = queue.SimpleQueue()
+        self.root.after(16, self._pump_ui)
+
+        # A small reused pool runs the background jobs, so button clicks and
+        # language switches don't each pay thread creation, and a voice load
+        # can proceed while a conversion is running. The token lets a queued
+        # voice load detect that a newer language selection superseded it
+        # and abort early.
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='tts')
+        # Set on window close so workers blocked on a coroutine result bail
+        # out; pool threads are non-daemon and would otherwise keep the
+        # process alive once the asyncio loop they wait on is stopped.
+        self._closing = threading.Event()
+        self._current_lang_token = 0
 
         self._setup_ui()
         # Load voices for the initially selected language
@@ -56,6 +101,62 @@ class PdfToSpeechApp:
             self.selected_language_display.set(initial_lang_display)
             self._on_language_selected(initial_lang_display) # Triggers voice loading
 
+    def _run_coroutine(self, coro):
+        """
+        Runs a coroutine on the app's background asyncio loop and blocks the
+        calling (worker) thread until it completes. Must not be called from
+        the Tkinter main thread.
+
+        Waits in short slices so a worker can notice the app closing and
+        abandon the coroutine instead of blocking forever on a future whose
+        loop has been stopped.
+        """
+        fut = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        while True:
+            try:
+                return fut.result(timeout=0.5)
+            except FutureTimeout:
+                if self._closing.is_set():
+                    fut.cancel()
+                    raise RuntimeError("application is closing")
+
+    def _queue_ui(self, fn):
+        """
+        Queues a UI update for the pump to run on the Tkinter main thread.
+        Safe to call from worker threads.
+        """
+        self._ui_ops.put(fn)
+
+    def _pump_ui(self):
+        """
+        Drains all queued UI updates in one pass, then reschedules itself.
+        The fixed 16 ms interval caps UI refreshes at roughly 60 Hz no matter
+        how fast worker threads produce updates. Runs on the Tk thread.
+        """
+        try:
+            while True:
+                try:
+                    fn = self._ui_ops.get_nowait()
+                except queue.Empty:
+                    break
+                fn()
+        finally:
+            # Re-arm even if a callback raised, so one bad update can't
+            # kill the pump and freeze all future status updates.
+            self.root.after(16, self._pump_ui)
+
+    def _on_close(self):
+        """
+        Closes the window and tears down the background machinery. The
+        closing flag unblocks any worker waiting in _run_coroutine, queued
+        jobs are cancelled, and the asyncio loop is stopped; the pool
+        threads then run out of work and the process can exit.
+        """
+        self._closing.set()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self.root.destroy()
+
     def _setup_ui(self):
         """
         Sets up the user interface elements of the application.
@@ -67,8 +168,11 @@ class PdfToSpeechApp:
         lbl_pdf_path = tk.Label(frame_pdf, text="Selected PDF:")
         lbl_pdf_path.pack(side=tk.LEFT, padx=(0, 5))
 
-        ent_pdf_path = tk.Entry(frame_pdf, textvariable=self.selected_pdf_path, width=50, state='readonly')
-        ent_pdf_path.pack(side=tk.LEFT, expand=True, fill="x", padx=(0, 5))
+        # A Label is enough here: the path is never typed into, and a
+        # readonly Entry still carries selection/caret machinery on every
+        # update. The sunken relief keeps the familiar field look.
+        lbl_pdf_path_value = tk.Label(frame_pdf, textvariable=self.selected_pdf_path, width=50, anchor='w', relief='sunken')
+        lbl_pdf_path_value.pack(side=tk.LEFT, expand=True, fill="x", padx=(0, 5))
 
         btn_browse_pdf = tk.Button(frame_pdf, text="Browse...", command=self._browse_pdf_file)
         btn_browse_pdf.pack(side=tk.LEFT)
@@ -84,13 +188,20 @@ class PdfToSpeechApp:
         if not language_names: # Fallback if the map is empty for some reason
             language_names = ["N/A"]
 
-        self.language_options_menu = tk.OptionMenu(
+        # A readonly Combobox takes its whole option list in one 'values'
+        # assignment (a single Tcl call), unlike OptionMenu which needs one
+        # menu entry plus one Python closure per option.
+        self.language_options_menu = ttk.Combobox(
             frame_language,
-            self.selected_language_display,
-            *language_names, # Unpack names for OptionMenu
-            command=self._on_language_selected # Command to execute on selection
+            textvariable=self.selected_language_display,
+            values=language_names,
+            state='readonly',
+            width=40
+        )
+        self.language_options_menu.bind(
+            "<<ComboboxSelected>>",
+            lambda event: self._on_language_selected(self.selected_language_display.get())
         )
-        self.language_options_menu.config(width=40)
         self.language_options_menu.pack(side=tk.LEFT, expand=True, fill="x")
 
 
@@ -101,8 +212,13 @@ class PdfToSpeechApp:
         lbl_voice = tk.Label(frame_voice, text="Select Voice:")
         lbl_voice.pack(side=tk.LEFT, padx=(0, 5))
 
-        self.voice_options_menu = tk.OptionMenu(frame_voice, self.selected_voice, "Select a language first...")
-        self.voice_options_menu.config(width=40)
+        self.voice_options_menu = ttk.Combobox(
+            frame_voice,
+            textvariable=self.selected_voice,
+            state='readonly',
+            width=40
+        )
+        self.selected_voice.set("Select a language first...")
         self.voice_options_menu.pack(side=tk.LEFT, expand=True, fill="x")
         self.voice_options_menu.config(state=tk.DISABLED) # Starts disabled
 
@@ -119,9 +235,16 @@ class PdfToSpeechApp:
         frame_status = tk.LabelFrame(self.root, text="Status", padx=10, pady=10)
         frame_status.pack(padx=10, pady=10, fill="both", expand=True)
 
-        lbl_status = tk.Label(frame_status, textvariable=self.status_message, wraplength=550, justify=tk.LEFT)
-        lbl_status.pack(anchor="nw")
-        self.status_message.set("Please select a PDF file and language to begin.")
+        # The status text is set via Label.config directly: a StringVar
+        # would route every update through a Tcl variable plus its write
+        # trace, which is pure overhead for a label only the code writes.
+        self.lbl_status = tk.Label(
+            frame_status,
+            text="Please select a PDF file and language to begin.",
+            wraplength=550,
+            justify=tk.LEFT,
+        )
+        self.lbl_status.pack(anchor="nw")
 
     def _on_language_selected(self, selected_lang_display_name: str):
         """
@@ -129,62 +252,86 @@ class PdfToSpeechApp:
         """
         language_code = self.available_languages_map.get(selected_lang_display_name)
         if language_code:
-            self.status_message.set(f"Loading voices for {selected_lang_display_name}...")
+            self.lbl_status.config(text=f"Loading voices for {selected_lang_display_name}...")
             # Clear and disable the voice menu while loading
             self.selected_voice.set("Loading...")
-            voice_menu = self.voice_options_menu["menu"]
-            voice_menu.delete(0, "end")
+            self.voice_options_menu['values'] = ()
             self.voice_options_menu.config(state=tk.DISABLED)
             self.btn_convert.config(state=tk.DISABLED) # Disable conversion button as well
 
             self._load_voices_for_language(language_code)
         else:
-            self.status_message.set(f"Error: Language code not found for {selected_lang_display_name}")
+            self.lbl_status.config(text=f"Error: Language code not found for {selected_lang_display_name}")
             self.voice_options_menu.config(state=tk.DISABLED)
 
 
     def _load_voices_for_language(self, language_code: str):
         """
-        Loads available voices for the specified language code asynchronously.
+        Loads available voices for the specified language code. The first
+        call fetches and buckets the voice list on a background thread; once
+        the buckets exist, a language switch is served synchronously on the
+        Tk thread with no thread spawn or network access at all.
         """
-        def fetch_and_update_voices_thread():
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                # Use edge_tts.list_voices() directly
-                all_voices = loop.run_until_complete(edge_tts.list_voices())
-                loop.close()
-
-                # Filter voices by the main language part of the locale code
-                # e.g., "en" for "en-US", "en-GB", etc.
-                lang_prefix = language_code.split('-')[0].lower()
-                language_specific_voices = [v for v in all_voices if v['Locale'].lower().startswith(lang_prefix)]
-
-
-                if language_specific_voices:
-                    self.loaded_voices_map = {
-                        f"{v['Name']} ({v['Gender']})": v['ShortName']
-                        for v in language_specific_voices
-                    }
-                    voice_display_names = list(self.loaded_voices_map.keys())
-                    self.root.after(0, self._update_voice_menu, voice_display_names)
-                    self.root.after(0, lambda: self.status_message.set(f"Voices loaded for {language_code}. Select a voice."))
-                else:
-                    self.root.after(0, self._update_voice_menu, []) # Empty list
-                    self.root.after(0, lambda: self.status_message.set(f"No voices found for language: {language_code}."))
+        # Each selection takes a fresh token; work for older selections —
+        # the fetch job and any apply it queued behind the UI pump — sees a
+        # mismatch and aborts instead of overwriting a newer selection.
+        self._current_lang_token += 1
+        token = self._current_lang_token
+
+        if self._display_map_by_prefix is not None:
+            self._apply_language_voices(language_code)
+            return
 
+        def fetch_and_update_voices_job():
+            if token != self._current_lang_token:
+                return  # superseded by a newer language selection
+            try:
+                from core.speech_synthesizer import get_all_voices
+
+                # Served from the memory/disk voice cache; only the first
+                # call in a cold cache actually hits the network.
+                all_voices = self._run_coroutine(get_all_voices())
+
+                # Bucket by the main language part of the locale code
+                # (e.g. "en" for "en-US", "en-GB") once, up front, and
+                # format the display names here so a language switch never
+                # formats anything.
+                display_maps = {}
+                for v in all_voices:
+                    prefix = v['Locale'].partition('-')[0].lower()
+                    display_maps.setdefault(prefix, {})[f"{v['Name']} ({v['Gender']})"] = v['ShortName']
+                self._display_map_by_prefix = display_maps
+
+                if token != self._current_lang_token:
+                    return
+                self._queue_ui(lambda: self._apply_language_voices(language_code, token))
             except Exception as e:
                 error_msg = f"Error loading voices: {e}"
-                print(error_msg)
-                self.root.after(0, lambda: self.status_message.set(error_msg))
-                self.root.after(0, self._update_voice_menu, []) # Update menu to error state
-            finally:
-                # Enable conversion button if a PDF is already selected and voices are loaded
-                if self.selected_pdf_path.get() and self.loaded_voices_map:
-                     self.root.after(0, lambda: self.btn_convert.config(state=tk.NORMAL))
+                logger.error("Error loading voices: %s", e)
+                self._queue_ui(lambda: self.lbl_status.config(text=error_msg))
+                self._queue_ui(lambda: self._update_voice_menu([]))  # Update menu to error state
 
+        self._pool.submit(fetch_and_update_voices_job)
 
-        threading.Thread(target=fetch_and_update_voices_thread, daemon=True).start()
+    def _apply_language_voices(self, language_code: str, token: int = None):
+        """
+        Fills the voice menu for the given language from the prebuilt
+        display maps. Runs on the Tk thread; _display_map_by_prefix must be
+        populated. A queued apply passes its selection token and is dropped
+        here if a newer selection has already been applied synchronously.
+        """
+        if token is not None and token != self._current_lang_token:
+            return  # superseded by a newer language selection
+        lang_prefix = self._lang_prefix_by_code.get(language_code) or language_code.partition('-')[0].lower()
+        display_map = self._display_map_by_prefix.get(lang_prefix)
+        if display_map:
+            self.loaded_voices_map = display_map
+            self._update_voice_menu(list(display_map.keys()))
+            self.lbl_status.config(text=f"Voices loaded for {language_code}. Select a voice.")
+        else:
+            self.loaded_voices_map = {}
+            self._update_voice_menu([])
+            self.lbl_status.config(text=f"No voices found for language: {language_code}.")
 
 
     def _update_voice_menu(self, voice_display_names: list):
@@ -192,14 +339,11 @@ class PdfToSpeechApp:
         Updates the voice OptionMenu with the given list of voice names.
         This method must be called from the main Tkinter thread.
         """
-        menu = self.voice_options_menu["menu"]
-        menu.delete(0, "end") # Clear old options
-
         if voice_display_names:
-            for name in voice_display_names:
-                menu.add_command(label=name, command=lambda value=name: self.selected_voice.set(value))
+            # One bulk assignment replaces the whole option list.
+            self.voice_options_menu['values'] = voice_display_names
             self.selected_voice.set(voice_display_names[0]) # Select the first voice by default
-            self.voice_options_menu.config(state=tk.NORMAL)
+            self.voice_options_menu.config(state='readonly')
             if self.selected_pdf_path.get(): # Enable convert button if PDF is selected
                 self.btn_convert.config(state=tk.NORMAL)
         else:
@@ -219,13 +363,14 @@ class PdfToSpeechApp:
         if file_path:
             self.selected_pdf_path.set(file_path)
             base_name = os.path.basename(file_path)
-            self.status_message.set(f"Selected: {base_name}. Ready if voice is selected.")
+            self._selected_pdf_basename = base_name
+            self.lbl_status.config(text=f"Selected: {base_name}. Ready if voice is selected.")
             # Enable convert button only if voices are loaded and a language is selected
-            if self.loaded_voices_map and self.voice_options_menu["state"] == tk.NORMAL:
+            if self.loaded_voices_map and str(self.voice_options_menu["state"]) != tk.DISABLED:
                 self.btn_convert.config(state=tk.NORMAL)
         else:
             if not self.selected_pdf_path.get(): # If no file was previously selected
-                self.status_message.set("No PDF file selected.")
+                self.lbl_status.config(text="No PDF file selected.")
                 self.btn_convert.config(state=tk.DISABLED)
 
 
@@ -246,63 +391,71 @@ class PdfToSpeechApp:
             messagebox.showerror("Error", "No voice selected or voice map is incorrect.")
             return
 
+        pdf_basename = self._selected_pdf_basename or os.path.basename(pdf_path)
         output_dir = os.path.dirname(pdf_path)
-        base_name_pdf = os.path.splitext(os.path.basename(pdf_path))[0]
-        output_audio_path = os.path.join(output_dir, f"{base_name_pdf}_speech.mp3")
+        output_audio_path = os.path.join(output_dir, f"{os.path.splitext(pdf_basename)[0]}_speech.mp3")
 
-        self.status_message.set(f"Starting conversion for '{os.path.basename(pdf_path)}'...")
+        self.lbl_status.config(text=f"Starting conversion for '{pdf_basename}'...")
         self.btn_convert.config(state=tk.DISABLED)
         self.language_options_menu.config(state=tk.DISABLED)
         self.voice_options_menu.config(state=tk.DISABLED)
 
 
-        thread = threading.Thread(
-            target=self._run_conversion,
-            args=(pdf_path, output_audio_path, voice_short_name),
-            daemon=True
+        self._pool.submit(
+            self._run_conversion, pdf_path, output_audio_path, voice_short_name, pdf_basename
         )
-        thread.start()
 
-    def _run_conversion(self, pdf_path: str, output_audio_path: str, voice: str):
+    def _run_conversion(self, pdf_path: str, output_audio_path: str, voice: str, pdf_basename: str):
         """
         The actual conversion logic that runs in a separate thread.
         """
+        last_bucket = [-1]
+
+        def progress_cb(bytes_written):
+            # Update the status bar at most once per 32 KB of audio so the
+            # UI queue isn't flooded by per-chunk callbacks.
+            bucket = bytes_written // (32 * 1024)
+            if bucket != last_bucket[0]:
+                last_bucket[0] = bucket
+                self._queue_ui(lambda: self.lbl_status.config(text=
+                    f"Synthesizing... {bytes_written // 1024} KB written"))
+
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            self.root.after(0, lambda: self.status_message.set(f"Extracting text from PDF '{os.path.basename(pdf_path)}'..."))
-            success, message = loop.run_until_complete(
-                convert_pdf_to_speech(pdf_path, output_audio_path, voice)
+            from core.main_controller import convert_pdf_to_speech
+
+            self._queue_ui(lambda: self.lbl_status.config(text=f"Extracting text from PDF '{pdf_basename}'..."))
+            success, message = self._run_coroutine(
+                convert_pdf_to_speech(pdf_path, output_audio_path, voice, progress_cb=progress_cb)
             )
-            loop.close()
 
             if success:
                 final_message = f"Success! Audio saved to: {output_audio_path}"
-                self.root.after(0, lambda: messagebox.showinfo("Success", final_message))
+                self._queue_ui(lambda: messagebox.showinfo("Success", final_message))
             else:
                 final_message = f"Conversion Failed: {message}"
-                self.root.after(0, lambda: messagebox.showerror("Error", final_message))
-            self.root.after(0, lambda: self.status_message.set(final_message))
+                self._queue_ui(lambda: messagebox.showerror("Error", final_message))
+            self._queue_ui(lambda: self.lbl_status.config(text=final_message))
 
         except Exception as e:
             error_msg = f"An unexpected error occurred in conversion thread: {e}"
-            print(error_msg) # Log to console as well
-            self.root.after(0, lambda: self.status_message.set(error_msg))
-            self.root.after(0, lambda: messagebox.showerror("Critical Error", error_msg))
+            logger.error("An unexpected error occurred in conversion thread: %s", e)
+            self._queue_ui(lambda: self.lbl_status.config(text=error_msg))
+            self._queue_ui(lambda: messagebox.showerror("Critical Error", error_msg))
         finally:
-            self.root.after(0, lambda: self.language_options_menu.config(state=tk.NORMAL))
-            self.root.after(0, lambda: self.voice_options_menu.config(state=tk.NORMAL if self.loaded_voices_map else tk.DISABLED))
+            self._queue_ui(lambda: self.language_options_menu.config(state='readonly'))
+            self._queue_ui(lambda: self.voice_options_menu.config(state='readonly' if self.loaded_voices_map else tk.DISABLED))
             # Enable conversion button if a PDF is selected and voices are available
             if self.selected_pdf_path.get() and self.loaded_voices_map:
-                 self.root.after(0, lambda: self.btn_convert.config(state=tk.NORMAL))
+                self._queue_ui(lambda: self.btn_convert.config(state=tk.NORMAL))
             else:
-                self.root.after(0, lambda: self.btn_convert.config(state=tk.DISABLED))
+                self._queue_ui(lambda: self.btn_convert.config(state=tk.DISABLED))
 
 
 def main_gui():
     """
     Main function to create and run the Tkinter application.
     """
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
     root = tk.Tk()
     app = PdfToSpeechApp(root)
     root.mainloop()